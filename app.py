@@ -1,39 +1,143 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import JSONProvider, DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 import os
+import logging
 import threading
 import json
 import random
+import re
+import functools
+import heapq
+import time
+from operator import itemgetter
 from datetime import datetime
+from difflib import get_close_matches
+
+try:
+    # Vectorized random draws and score matrices; falls back to the random module when missing
+    import numpy as np
+    _RNG = np.random.default_rng()
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    # C-accelerated fuzzy matching; falls back to substring matching when missing
+    from rapidfuzz import process, fuzz
+    _HAS_RAPIDFUZZ = True
+except ImportError:
+    _HAS_RAPIDFUZZ = False
+
+try:
+    # C JSON encoder/decoder; falls back to Flask's stdlib json provider when missing
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    # Serves /static files outside Flask's routing (sendfile + cache headers)
+    from whitenoise import WhiteNoise
+    _HAS_WHITENOISE = True
+except ImportError:
+    _HAS_WHITENOISE = False
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Numpy values from the trained model are serialized natively; anything else
+    orjson can't handle goes through Flask's default conversions.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                            option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Initialize Flask app with specified folders for static files and templates
 app = Flask(__name__, static_folder='static', template_folder='templates')
+# Reject oversized request bodies (413) before they reach the predictor
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024
+if _HAS_ORJSON:
+    app.json = ORJSONProvider(app)
+# Flask's built-in /static route is used when whitenoise isn't installed
+if _HAS_WHITENOISE:
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=app.static_folder, prefix='static/')
+
+# Prediction cache limits: entries kept, and the largest input (chars / symptoms) that gets cached
+PREDICT_CACHE_SIZE = 4096
+MAX_CACHED_INPUT_LENGTH = 1024
+MAX_CACHED_SYMPTOMS = 32
+
+# comma-separated symptom tokens with surrounding whitespace trimmed, empty tokens skipped
+_TOKEN_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
 
 # stores the ai prediction model
 predictor = None
+# whether the loaded predictor is the SimplePredictor demo fallback (set once in load_predictor)
+_IS_DEMO_MODE = False
+# guards predictor initialization so concurrent requests load the model only once
+_predictor_lock = threading.Lock()
+# makes sure the background warmup thread is started at most once
+_warmup_started = False
+_warmup_lock = threading.Lock()
+
+# Pre-serialized JSON bodies for endpoints that only change when the predictor loads
+_SYMPTOMS_RESPONSE_BYTES = None
+_INFO_RESPONSE_BYTES = None
+_HEALTH_RESPONSE_PREFIX = None
+
+# (epoch second, formatted timestamp) of the last formatted timestamp
+_timestamp_cache = (None, None)
+
+def current_timestamp():
+    """
+    Returns the current local time as an ISO string at second resolution.
+    The string is formatted at most once per second and reused in between.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if second != now:
+        formatted = datetime.fromtimestamp(now).isoformat()
+        _timestamp_cache = (now, formatted)
+    return formatted
 
 def load_predictor():
     """
     Loads the disease prediction model.
     If the main predictor (DiseasePredictor) is not available,
     it falls back to SimplePredictor for demo purposes.
+    Safe to call from multiple threads; the model is loaded only once.
+    The global predictor is published last, so any thread that sees it
+    also sees the demo-mode flag and cached responses built for it.
     """
-    global predictor
-    if predictor is None:
+    global predictor, _IS_DEMO_MODE
+    if predictor is not None:
+        return
+    with _predictor_lock:
+        if predictor is not None:
+            return
         try:
             # Try importing and loading the trained disease predictor
             from predict_disease import DiseasePredictor
-            predictor = DiseasePredictor(model_dir='models')
+            loaded = DiseasePredictor(model_dir='models')
             print("✅ AI Predictor loaded successfully!")
         except ImportError as e:
             # If import fails, use fallback predictor
             print(f"❌ Could not import predictor: {e}")
-            predictor = SimplePredictor()
+            loaded = SimplePredictor()
             print("✅ Using simple fallback predictor")
         except Exception as e:
             # If any other error occurs, fallback to simple version
             print(f"❌ Predictor failed to load: {e}")
-            predictor = SimplePredictor()
+            loaded = SimplePredictor()
             print("✅ Using simple fallback predictor")
+        _IS_DEMO_MODE = isinstance(loaded, SimplePredictor)
+        _build_static_responses(loaded)
+        predictor = loaded
 
 class SimplePredictor:
     """
@@ -76,15 +180,35 @@ class SimplePredictor:
                 'common_symptoms': ['sneezing', 'runny nose', 'rash', 'fatigue']
             }
         }
+        # Lowercased symptom names, computed once for case-insensitive matching
+        self._symptom_list_lower = [s.lower() for s in self.symptom_list]
+        # Lowercased name -> original symptom, for constant-time exact lookups
+        self._symptom_lookup = dict(zip(self._symptom_list_lower, self.symptom_list))
+        # Precompute each disease's symptom set once instead of per request
+        self._disease_symptom_sets = {
+            disease: frozenset(info['common_symptoms'])
+            for disease, info in self.diseases_db.items()
+        }
+        self._disease_items = list(self._disease_symptom_sets.items())
+        # Memoize predictions per normalized symptom input
+        self._predict_cached = functools.lru_cache(maxsize=PREDICT_CACHE_SIZE)(self._predict_core)
         
     def get_closest_symptom_match(self, symptom: str):
         """
-        Match input symptom to closest known symptom (simple substring match).
+        Match input symptom to closest known symptom.
+        Uses rapidfuzz when available, otherwise a simple substring match.
         Returns best matching symptom or None if no match found.
         """
         symptom = symptom.lower().strip()
-        for known_symptom in self.symptom_list:
-            if symptom in known_symptom.lower() or known_symptom.lower() in symptom:
+        if symptom in self._symptom_lookup:
+            return self._symptom_lookup[symptom]
+
+        if _HAS_RAPIDFUZZ:
+            hit = process.extractOne(symptom, self._symptom_list_lower, scorer=fuzz.WRatio, score_cutoff=75)
+            return self.symptom_list[hit[2]] if hit else None
+
+        for known_lower, known_symptom in zip(self._symptom_list_lower, self.symptom_list):
+            if symptom in known_lower or known_lower in symptom:
                 return known_symptom
         return None
     
@@ -93,13 +217,33 @@ class SimplePredictor:
         Parse and classify user input symptoms into:
         - matched: valid known symptoms
         - unmatched: not recognized
-        - suggested: alternative guesses for unmatched ones
+        - suggested: closest known symptoms for unmatched ones
         """
-        input_symptoms = [s.strip() for s in symptom_input.split(',') if s.strip()]
+        input_symptoms = _TOKEN_RE.findall(symptom_input)
         
         matched = []
         unmatched = []
         suggested = []
+
+        if _HAS_RAPIDFUZZ and _HAS_NUMPY and input_symptoms:
+            # Score every input against every known symptom in one batch (N x V matrix).
+            # float64 keeps the same precision as extractOne so both paths apply the cutoff identically
+            scores = process.cdist([s.lower() for s in input_symptoms], self._symptom_list_lower,
+                                   scorer=fuzz.WRatio, dtype=np.float64)
+            best = scores.argmax(axis=1)
+            top_n = min(3, len(self.symptom_list))
+            for i, symptom in enumerate(input_symptoms):
+                if scores[i, best[i]] >= 75:
+                    matched.append(self.symptom_list[best[i]])
+                else:
+                    unmatched.append(symptom)
+                    # Suggest the closest scoring symptoms from the same matrix
+                    top = np.argpartition(scores[i], -top_n)[-top_n:]
+                    top = top[np.argsort(scores[i, top])[::-1]]
+                    suggestions = [self.symptom_list[j] for j in top if scores[i, j] > 0]
+                    if suggestions:
+                        suggested.append((symptom, suggestions))
+            return matched, unmatched, suggested
         
         for symptom in input_symptoms:
             match = self.get_closest_symptom_match(symptom)
@@ -107,12 +251,23 @@ class SimplePredictor:
                 matched.append(match)
             else:
                 unmatched.append(symptom)
-                # Suggest random symptoms if unrecognized
-                suggestions = random.sample(self.symptom_list, min(3, len(self.symptom_list)))
-                suggested.append((symptom, suggestions))
+                # Get potential suggestions
+                matches = get_close_matches(symptom.lower(), self._symptom_list_lower, n=3, cutoff=0.4)
+                if matches:
+                    suggested.append((symptom, [self._symptom_lookup[m] for m in matches]))
                 
         return matched, unmatched, suggested
     
+    @staticmethod
+    def normalize_symptom_input(symptom_input: str):
+        """
+        Normalize raw symptom input into a canonical string
+        (lowercased, stripped, deduplicated and sorted) so that
+        equivalent queries share the same cache entry.
+        """
+        tokens = set(_TOKEN_RE.findall(symptom_input.lower()))
+        return ', '.join(sorted(tokens))
+
     def predict_and_info(self, symptom_input: str):
         """
         Generate a simulated prediction result with:
@@ -120,6 +275,43 @@ class SimplePredictor:
         - alternative predictions
         - symptom details
         - precautionary advice
+        Parsing and scoring for short inputs are cached per normalized input;
+        the random symptom details and the timestamp are fresh on every call.
+        """
+        normalized = self.normalize_symptom_input(symptom_input)
+        # Only cache small inputs so large requests can't pin memory in the cache
+        if len(normalized) <= MAX_CACHED_INPUT_LENGTH and normalized.count(',') < MAX_CACHED_SYMPTOMS:
+            results = dict(self._predict_cached(normalized))
+        else:
+            results = dict(self._predict_core(normalized))
+        if 'error' not in results:
+            results['symptom_details'] = self._simulate_symptom_details(results['matched_symptoms'])
+            results['timestamp'] = current_timestamp()
+        return results
+
+    def _simulate_symptom_details(self, matched_symptoms):
+        """
+        Generate random severity (3 to 7) and importance scores for matched symptoms,
+        drawn in one batch and sorted by severity for display.
+        """
+        if _HAS_NUMPY:
+            severities = _RNG.integers(3, 8, len(matched_symptoms)).tolist()
+            importances = _RNG.uniform(0.1, 0.9, len(matched_symptoms)).tolist()
+        else:
+            severities = [random.randint(3, 7) for _ in matched_symptoms]
+            importances = [random.uniform(0.1, 0.9) for _ in matched_symptoms]
+        symptom_details = [
+            {'symptom': symptom, 'severity': severity, 'importance': importance}
+            for symptom, severity, importance in zip(matched_symptoms, severities, importances)
+        ]
+        symptom_details.sort(key=lambda x: x['severity'], reverse=True)
+        return symptom_details
+
+    def _predict_core(self, symptom_input: str):
+        """
+        Build the deterministic part of the prediction (parsing and disease scoring)
+        for an already normalized symptom input.
+        Wrapped with lru_cache in __init__, so the returned dict must not be mutated.
         """
         matched_symptoms, unmatched, suggested = self.parse_symptoms(symptom_input)
         
@@ -133,16 +325,17 @@ class SimplePredictor:
             }
         
         # Calculate disease match scores based on symptom overlap
+        matched_set = frozenset(matched_symptoms)
         symptom_scores = {}
-        for disease, info in self.diseases_db.items():
-            score = len(set(matched_symptoms) & set(info['common_symptoms']))
-            symptom_scores[disease] = score
+        for disease, disease_symptoms in self._disease_items:
+            symptom_scores[disease] = len(matched_set & disease_symptoms)
         
-        # Sort diseases in descending by score
-        sorted_diseases = sorted(symptom_scores.items(), key=lambda x: x[1], reverse=True)
+        # Top disease plus up to 3 alternatives, in descending order by score
+        sorted_diseases = heapq.nlargest(4, symptom_scores.items(), key=itemgetter(1))
+        max_score = sorted_diseases[0][1] if sorted_diseases else 0
         
         # If no strong match, give general advice
-        if not sorted_diseases or sorted_diseases[0][1] == 0:
+        if max_score == 0:
             primary_disease = 'General Medical Consultation'
             primary_info = {
                 'description': 'Based on your symptoms, it is recommended to consult with a healthcare professional for proper diagnosis.',
@@ -154,7 +347,6 @@ class SimplePredictor:
             # Get top disease with highest match
             primary_disease = sorted_diseases[0][0]
             primary_info = self.diseases_db[primary_disease]
-            max_score = max(symptom_scores.values())
             confidence = min(0.95, 0.3 + (symptom_scores[primary_disease] / max_score) * 0.65)
         
         # stores the next best 3 matching disease if only they have positive score
@@ -162,7 +354,7 @@ class SimplePredictor:
         for disease, score in sorted_diseases[1:4]:
             if score > 0:
                 alt_info = self.diseases_db.get(disease, {})
-                alt_confidence = min(0.8, 0.2 + (score / max(symptom_scores.values())) * 0.6)
+                alt_confidence = min(0.8, 0.2 + (score / max_score) * 0.6)
                 alternative_predictions.append({
                     'disease': disease,
                     'probability': alt_confidence,
@@ -170,19 +362,6 @@ class SimplePredictor:
                     'precautions': alt_info.get('precautions', [])
                 })
         
-        # Generate random score from(3 to 7 ) for matched symptoms
-        symptom_details = []
-        for symptom in matched_symptoms:
-            severity = random.randint(3, 7)
-            symptom_details.append({
-                'symptom': symptom,
-                'severity': severity,
-                'importance': random.uniform(0.1, 0.9)
-            })
-        
-        # Sort symptoms by severity for display
-        symptom_details.sort(key=lambda x: x['severity'], reverse=True)
-        
         return {
             'top_prediction': {
                 'disease': primary_disease,
@@ -192,15 +371,88 @@ class SimplePredictor:
             },
             'alternative_predictions': alternative_predictions,
             'matched_symptoms': matched_symptoms,
-            'symptom_details': symptom_details,
             'unmatched_symptoms': unmatched,
             'symptom_suggestions': suggested,
-            'demo_mode': True,
-            'timestamp': datetime.now().isoformat()
+            'demo_mode': True
         }
 
-# Load the ai model into a separate thread so the server can start immediately
-threading.Thread(target=load_predictor).start()
+def _build_static_responses(loaded=None):
+    """
+    Serialize the /api/symptoms, /api/info and /api/health payloads once
+    for the given predictor (None while loading) so those views only copy cached bytes.
+    """
+    global _SYMPTOMS_RESPONSE_BYTES, _INFO_RESPONSE_BYTES, _HEALTH_RESPONSE_PREFIX
+    demo_mode = _IS_DEMO_MODE
+
+    if loaded is not None:
+        # Get symptom list from predictor
+        if hasattr(loaded, 'symptom_list'):
+            symptoms = loaded.symptom_list
+        else:
+            symptoms = [
+                'fever', 'cough', 'headache', 'fatigue', 'nausea', 'vomiting',
+                'sneezing', 'runny nose', 'sore throat', 'body aches', 'chills',
+                'chest pain', 'shortness of breath', 'dizziness', 'rash'
+            ]
+        _SYMPTOMS_RESPONSE_BYTES = app.json.dumps({
+            'status': 'success',
+            'symptoms': symptoms,
+            'total_symptoms': len(symptoms),
+            'demo_mode': demo_mode
+        }).encode()
+
+    _INFO_RESPONSE_BYTES = app.json.dumps({
+        'name': 'AI Health Assistant API',
+        'version': '1.0.0',
+        'description': 'Disease prediction based on symptoms',
+        'endpoints': {
+            'POST /api/predict': 'Predict disease from symptoms',
+            'GET /api/symptoms': 'Get list of available symptoms',
+            'GET /api/health': 'Health check',
+            'GET /api/info': 'This information'
+        },
+        'demo_mode': demo_mode
+    }).encode()
+
+    # Everything but the closing brace; the timestamp is appended per request
+    _HEALTH_RESPONSE_PREFIX = app.json.dumps({
+        'status': 'healthy',
+        'service': 'AI Health Assistant',
+        'predictor_loaded': loaded is not None,
+        'predictor_type': 'SimplePredictor' if demo_mode else 'DiseasePredictor'
+    }).encode()[:-1]
+
+_build_static_responses()
+
+def _static_json(body):
+    """
+    Wrap an already serialized JSON body in a 200 response with an explicit
+    Content-Length, so servers send it in one piece instead of chunked.
+    """
+    return Response(body, status=200, headers={
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(body))
+    })
+
+def _warmup():
+    """
+    Load the ai model in a background thread so the server can start immediately.
+    Only the first call starts a thread.
+    """
+    global _warmup_started
+    if _warmup_started:
+        return
+    with _warmup_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    threading.Thread(target=load_predictor, daemon=True).start()
+
+@app.before_request
+def _warmup_on_first_request():
+    """Start the model warmup under external WSGI servers (e.g. gunicorn), which skip __main__."""
+    if predictor is None:
+        _warmup()
 
 @app.route('/ai-assistant')
 def ai_assistant():
@@ -222,7 +474,12 @@ def predict():
     
     try:
         # Api responsible for disease prediction
-        data = request.get_json()
+        raw_data = request.get_data()
+        try:
+            data = app.json.loads(raw_data) if raw_data else None
+        except ValueError:
+            # orjson's and the stdlib's JSONDecodeError are both ValueErrors
+            return jsonify({'error': 'Invalid JSON'}), 400
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
             
@@ -244,12 +501,15 @@ def predict():
             'status': 'success',
             'messages': messages,
             'raw_results': results,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': current_timestamp()
         }
        
         # Sends the result back to the frontend as a JSON response.
         return jsonify(response_data), 200
 
+    except HTTPException:
+        # Let Flask's error handlers answer HTTP errors (e.g. 413 for oversized bodies)
+        raise
     except Exception as e:
         # Log and return error if prediction fails
         app.logger.error(f"Error in prediction: {str(e)}")
@@ -270,22 +530,7 @@ def get_symptoms():
         if predictor is None:
             load_predictor()
         
-        # Get symptom list from predictor
-        if hasattr(predictor, 'symptom_list'):
-            symptoms = predictor.symptom_list
-        else:
-            symptoms = [
-                'fever', 'cough', 'headache', 'fatigue', 'nausea', 'vomiting',
-                'sneezing', 'runny nose', 'sore throat', 'body aches', 'chills',
-                'chest pain', 'shortness of breath', 'dizziness', 'rash'
-            ]
-        
-        return jsonify({
-            'status': 'success',
-            'symptoms': symptoms,
-            'total_symptoms': len(symptoms),
-            'demo_mode': isinstance(predictor, SimplePredictor)
-        }), 200
+        return _static_json(_SYMPTOMS_RESPONSE_BYTES)
 
     except Exception as e:
         # Handle errors in fetching symptoms
@@ -305,13 +550,8 @@ def health_check():
     """
     Simple health check API to verify if the service is running properly.
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'AI Health Assistant',
-        'timestamp': datetime.now().isoformat(),
-        'predictor_loaded': predictor is not None,
-        'predictor_type': 'SimplePredictor' if isinstance(predictor, SimplePredictor) else 'DiseasePredictor'
-    }), 200
+    body = b'%s,"timestamp":"%s"}' % (_HEALTH_RESPONSE_PREFIX, current_timestamp().encode())
+    return _static_json(body)
 
 # To display details about the available API endpoints.
 @app.route('/api/info', methods=['GET'])
@@ -319,18 +559,21 @@ def api_info():
     """
     Returns API metadata including version, description, and available endpoints.
     """
-    return jsonify({
-        'name': 'AI Health Assistant API',
-        'version': '1.0.0',
-        'description': 'Disease prediction based on symptoms',
-        'endpoints': {
-            'POST /api/predict': 'Predict disease from symptoms',
-            'GET /api/symptoms': 'Get list of available symptoms',
-            'GET /api/health': 'Health check',
-            'GET /api/info': 'This information'
-        },
-        'demo_mode': isinstance(predictor, SimplePredictor)
-    }), 200
+    return _static_json(_INFO_RESPONSE_BYTES)
+
+# Chat messages that never change between requests; shared, so never mutate them
+_DEMO_MODE_ERROR_MSG = {
+    'type': 'info',
+    'content': "💡 **Demo Mode**: Using sample data for demonstration."
+}
+_DEMO_MODE_MSG = {
+    'type': 'info',
+    'content': "💡 **Demo Mode**: Showing sample predictions. For accurate results, train the model with medical data."
+}
+_DISCLAIMER_MSG = {
+    'type': 'disclaimer',
+    'content': "⚠️ **Important Disclaimer:** This is a demonstration system and not a substitute for professional medical advice. Always consult with qualified healthcare providers for medical diagnosis and treatment."
+}
 
 def format_results_for_chat(results):
     """
@@ -349,29 +592,23 @@ def format_results_for_chat(results):
 
 #provides alternative suggestion if symptoms are not when symptoms are not recognized
         if results.get('suggestions'):
-            suggestions_text = "💡 Did you mean:\n"
-            for original, suggestions in results['suggestions']:
-                suggestions_text += f"• **{original}** → {', '.join(suggestions)}\n"
+            parts = ["💡 Did you mean:"]
+            parts.extend(f"• **{original}** → {', '.join(suggestions)}"
+                         for original, suggestions in results['suggestions'])
             messages.append({
                 'type': 'suggestions',
-                'content': suggestions_text
+                'content': "\n".join(parts) + "\n"
             })
             
         # Adds a message telling the user that the system is using sample demo data and not real medical AI.
         if results.get('demo_mode'):
-            messages.append({
-                'type': 'info',
-                'content': "💡 **Demo Mode**: Using sample data for demonstration."
-            })
+            messages.append(_DEMO_MODE_ERROR_MSG)
             
         return messages
 
     # Show demo mode info tells that predictions are only sample based not from a real trained model
     if results.get('demo_mode'):
-        messages.append({
-            'type': 'info',
-            'content': "💡 **Demo Mode**: Showing sample predictions. For accurate results, train the model with medical data."
-        })
+        messages.append(_DEMO_MODE_MSG)
 
     # It then takes the top predicted disease from the results and adds it to the chat message list
     pred = results['top_prediction']
@@ -385,68 +622,56 @@ def format_results_for_chat(results):
 
     # Add precautions section if the predicted disease has precaution available in the chat
     if pred['precautions']:
-        precautions_text = "🛡️ **Recommended Precautions:**\n"
-        for i, p in enumerate(pred['precautions'], 1):
-            precautions_text += f"{i}. {p}\n"
+        parts = ["🛡️ **Recommended Precautions:**"]
+        parts.extend(f"{i}. {p}" for i, p in enumerate(pred['precautions'], 1))
         messages.append({
             'type': 'precautions',
-            'content': precautions_text
+            'content': "\n".join(parts) + "\n"
         })
 
     # Add alternative disease suggestions beside the main one in the chat
     if results['alternative_predictions']:
-        alt_text = "🔄 **Alternative Possibilities:**\n"
-        for alt in results['alternative_predictions']:
-            alt_text += f"• {alt['disease']} ({alt['probability']*100:.1f}%)\n"
+        parts = ["🔄 **Alternative Possibilities:**"]
+        parts.extend(f"• {alt['disease']} ({alt['probability']*100:.1f}%)"
+                     for alt in results['alternative_predictions'])
         messages.append({
             'type': 'alternatives',
-            'content': alt_text
+            'content': "\n".join(parts) + "\n"
         })
 
     # Add detailed symptom analysis it tells how severe a disease is and adds it to the chat
     if results['symptom_details']:
-        symptom_text = "🩺 **Symptom Analysis:**\n"
-        symptom_text += f"• **Total symptoms identified**: {len(results['matched_symptoms'])}\n"
-        symptom_text += "• **Severity scores** (1-7 scale, higher = more severe):\n"
-        
-        for detail in results['symptom_details']:
-            severity_stars = '⭐' * detail['severity']
-            symptom_text += f"  - {detail['symptom']}: {detail['severity']}/7 {severity_stars}\n"
-            
+        parts = [
+            "🩺 **Symptom Analysis:**",
+            f"• **Total symptoms identified**: {len(results['matched_symptoms'])}",
+            "• **Severity scores** (1-7 scale, higher = more severe):"
+        ]
+        parts.extend(f"  - {detail['symptom']}: {detail['severity']}/7 {'⭐' * detail['severity']}"
+                     for detail in results['symptom_details'])
         messages.append({
             'type': 'symptoms',
-            'content': symptom_text
+            'content': "\n".join(parts) + "\n"
         })
 
     # Handle unmatched symptoms
     if results['unmatched_symptoms']:
-        unmatched_text = "❓ **Unrecognized Symptoms:**\n"
-        unmatched_text += f"{', '.join(results['unmatched_symptoms'])}\n"
+        parts = ["❓ **Unrecognized Symptoms:**", ', '.join(results['unmatched_symptoms'])]
         
         if results['symptom_suggestions']:
-            unmatched_text += "\n💡 **Suggestions:**\n"
-            for original, suggestions in results['suggestions']:
-                unmatched_text += f"• '{original}' → {', '.join(suggestions[:2])}\n"
+            parts.extend(["", "💡 **Suggestions:**"])
+            parts.extend(f"• '{original}' → {', '.join(suggestions[:2])}"
+                         for original, suggestions in results['symptom_suggestions'])
                 
         messages.append({
             'type': 'unmatched',
-            'content': unmatched_text
+            'content': "\n".join(parts) + "\n"
         })
 
     # Final disclaimer message
-    messages.append({
-        'type': 'disclaimer',
-        'content': "⚠️ **Important Disclaimer:** This is a demonstration system and not a substitute for professional medical advice. Always consult with qualified healthcare providers for medical diagnosis and treatment."
-    })
+    messages.append(_DISCLAIMER_MSG)
 
     return messages
 
-@app.route('/favicon.ico')
-def favicon():
-    """Serve favicon for the web interface."""
-    return send_from_directory(os.path.join(app.root_path, 'static'),
-                               'favicon.ico', mimetype='image/vnd.microsoft.icon')
-
 # Custom error handlers for common HTTP errors
 @app.errorhandler(404)
 def not_found(error):
@@ -463,22 +688,26 @@ def method_not_allowed(error):
     """Handle 405 - Method Not Allowed errors"""
     return jsonify({'error': 'Method not allowed'}), 405
 
-# Serve static files manually when requested
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files from /static directory to the browser"""
-    return send_from_directory(app.static_folder, filename)
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle 413 - Request Entity Too Large errors"""
+    return jsonify({'error': 'Request too large'}), 413
 
 # Main entry point of the Flask app
 if __name__ == '__main__':
     port = int(os.environ.get('AI_PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
+    # Thread/process counts for the production servers, tunable per machine
+    threads = int(os.environ.get('AI_THREADS', os.cpu_count() or 4))
+    workers = int(os.environ.get('AI_WORKERS', os.cpu_count() or 4))
     
     #Prints server startup information in the terminal:
     print(f"""
     🤖 AI Health Assistant Server
     =============================
     ✅ Starting server on port {port}
+    ⚙️ Mode: {'debug (Flask dev server)' if debug else f'production (waitress, {threads} threads)'}
+    🚀 Multi-process: gunicorn -w {workers} -k gthread --threads 4 -b 0.0.0.0:{port} app:app
     🔗 AI Assistant: http://localhost:{port}/ai-assistant
     🔌 Health Check: http://localhost:{port}/api/health
     📚 API Info: http://localhost:{port}/api/info
@@ -486,5 +715,19 @@ if __name__ == '__main__':
     =============================
     """)
     
-    # Start Flask server 
-    app.run(debug=debug, host='0.0.0.0', port=port)
+    _warmup()
+
+    if debug:
+        # Start Flask development server
+        app.run(debug=debug, host='0.0.0.0', port=port)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("❌ waitress is not installed, falling back to the Flask server")
+            # Skip werkzeug's per-request access log; leave access logging to the reverse proxy.
+            # waitress doesn't write access logs, so its own 'waitress' logger is left as is.
+            logging.getLogger('werkzeug').setLevel(logging.ERROR)
+            app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=port, threads=threads)